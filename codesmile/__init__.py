@@ -1,4 +1,5 @@
-from .analyzer import CodeSmileAnalyzer
-
 __version__ = "1.0.0"
-__all__ = ["CodeSmileAnalyzer"]
\ No newline at end of file
+
+from .analyzer import CodeSmileAnalyzer, get_default_analyzer
+
+__all__ = ["CodeSmileAnalyzer", "get_default_analyzer"]
\ No newline at end of file
@@ -2,10 +2,11 @@
 import os
 import json
 import tempfile
+from functools import lru_cache
 from typing import List, Union, Dict, Any
 import pandas as pd
 
-from .components.inspector import Inspector
+from .components.inspector import DETECTION_COLUMNS, Inspector, inspect_safely
 from .utils.file_utils import FileUtils
 
 
@@ -29,13 +30,19 @@ class CodeSmileAnalyzer:
         package_dir = os.path.dirname(__file__)
         return os.path.join(package_dir, "resources", filename)
     
-    def analyze(self, paths: Union[str, List[str]]) -> str:
+    def analyze(
+        self, paths: Union[str, List[str]], workers: int = 1
+    ) -> str:
         """
         Analyze Python files for ML-specific code smells.
         
         Args:
             paths: Single path (str) or list of paths to analyze.
                    Can be files (.py) or directories.
+            workers: Number of worker processes to inspect the files with;
+                     the default of 1 inspects them in this process. With
+                     more than one, the calling script needs an
+                     ``if __name__ == "__main__":`` guard.
         
         Returns:
             JSON string with analysis results
@@ -64,33 +71,26 @@ class CodeSmileAnalyzer:
         smells_by_file = {}
         smells_by_type = {}
         
-        for file_path in python_files:
-            try:
-                df_result = self.inspector.inspect(file_path)
-                
-                file_smells = len(df_result)
-                if file_smells > 0:
-                    smells_by_file[file_path] = file_smells
-                    
-                    for _, row in df_result.iterrows():
-                        detection = {
-                            "filename": row['filename'],
-                            "function_name": row['function_name'],
-                            "smell_name": row['smell_name'],
-                            "line": row['line'],
-                            "description": row['description'],
-                            "additional_info": row['additional_info']
-                        }
-                        all_detections.append(detection)
-                        
-                        # Count by type
-                        smell_name = row['smell_name']
-                        smells_by_type[smell_name] = smells_by_type.get(smell_name, 0) + 1
-                        
-            except Exception as e:
-                if self.debug:
-                    print(f"Warning: Error analyzing {file_path}: {e}")
+        for file_path, (df_result, _) in zip(
+            python_files,
+            self.inspector.map(inspect_safely, python_files, workers),
+        ):
+            if df_result is None:
                 continue
+
+            file_smells = len(df_result)
+            if file_smells > 0:
+                smells_by_file[file_path] = file_smells
+                all_detections.extend(
+                    df_result[DETECTION_COLUMNS].to_dict(orient="records")
+                )
+                
+                # Count by type
+                type_counts = df_result["smell_name"].value_counts(sort=False)
+                for smell_name, count in type_counts.items():
+                    smells_by_type[smell_name] = (
+                        smells_by_type.get(smell_name, 0) + int(count)
+                    )
         
         result = {
             "total_smells": len(all_detections),
@@ -99,4 +99,30 @@ class CodeSmileAnalyzer:
             "detections": all_detections
         }
         
-        return json.dumps(result, indent=2)
\ No newline at end of file
+        return json.dumps(result, indent=2)
+
+
+def get_default_analyzer(debug: bool = False) -> CodeSmileAnalyzer:
+    """
+    Returns a process-wide CodeSmileAnalyzer, created on first use.
+
+    Long-running processes that analyze code repeatedly should use this
+    instead of building a new analyzer per call, so that the Inspector
+    and its dictionaries are set up only once. There is one shared
+    instance per value of `debug`.
+
+    Args:
+        debug: Whether the analyzer prints warnings for failed files
+
+    Returns:
+        The shared CodeSmileAnalyzer instance for `debug`
+    """
+    # Passed positionally, so that every way of calling this function
+    # with the same value maps to the same cache entry
+    return _default_analyzer(bool(debug))
+
+
+@lru_cache(maxsize=None)
+def _default_analyzer(debug: bool) -> CodeSmileAnalyzer:
+    """Creates the shared CodeSmileAnalyzer of `get_default_analyzer`."""
+    return CodeSmileAnalyzer(debug=debug)
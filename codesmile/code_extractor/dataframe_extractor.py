@@ -1,7 +1,30 @@
 import ast
+import os
+from functools import lru_cache
 import pandas as pd
 
 
+def _read_dataframe_methods(path: str) -> tuple[str, ...]:
+    """
+    Reads the DataFrame methods from a dictionary CSV once per process,
+    so that every extractor built on the same file shares the result.
+    The file is identified by its absolute path and modification time, so
+    an edited file, or a relative path resolved from another working
+    directory, is read again.
+    """
+    path = os.path.abspath(path)
+    return _read_dataframe_methods_version(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_dataframe_methods_version(
+    path: str, mtime_ns: int
+) -> tuple[str, ...]:
+    """Reads the methods of the version last modified at `mtime_ns`."""
+    df = pd.read_csv(path, dtype={"method": "string"})
+    return tuple(df["method"].tolist())
+
+
 class DataFrameExtractor:
     """
     A utility class for extracting information related to Pandas DataFrames
@@ -34,8 +57,7 @@ class DataFrameExtractor:
         Returns:
         - None: Updates `self.df_methods` with a list of method names.
         """
-        df = pd.read_csv(path, dtype={"method": "string"})
-        self.df_methods = df["method"].tolist()
+        self.df_methods = list(_read_dataframe_methods(path))
 
     def extract_dataframe_variables(
         self, fun_node: ast.AST, alias: str
@@ -1,7 +1,27 @@
 import os
+from functools import lru_cache
 import pandas as pd
 
 
+def _read_dictionary(path: str) -> pd.DataFrame:
+    """
+    Reads a dictionary CSV once per process, so that every extractor (and
+    every Inspector) built on the same file shares a single parsed copy.
+    The file is identified by its absolute path and modification time, so
+    an edited file, or a relative path resolved from another working
+    directory, is read again. The returned DataFrame is shared and must
+    not be modified.
+    """
+    path = os.path.abspath(path)
+    return _read_dictionary_version(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_dictionary_version(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Reads the version of a dictionary CSV last modified at `mtime_ns`."""
+    return pd.read_csv(path)
+
+
 class ModelExtractor:
     """
     A utility class for extracting information
@@ -52,7 +72,7 @@ class ModelExtractor:
                 f"Model file not found: {self.models_path}"
             )
 
-        df = pd.read_csv(self.models_path)
+        df = _read_dictionary(self.models_path)
         if "method" not in df.columns or "library" not in df.columns:
             raise ValueError(
                 "Expected columns 'method' and"
@@ -86,7 +106,7 @@ class ModelExtractor:
                 f"Tensor operations file not found: {self.tensors_path}"
             )
 
-        df = pd.read_csv(self.tensors_path)
+        df = _read_dictionary(self.tensors_path)
         if "number_of_tensors_input" not in df.columns:
             raise ValueError(
                 "Expected column 'number_of_tensors_input'"
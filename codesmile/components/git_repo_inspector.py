@@ -1,12 +1,21 @@
 import os
 import shutil
+import subprocess
 from git import Repo
 
+# Separators of the `git log` records: fields are NUL-terminated and each
+# commit starts with a record separator, which cannot occur in the fields.
+_FIELD_SEP = "\x00"
+_COMMIT_SEP = "\x1e"
+_LOG_FORMAT = "%x1e%H%x00%ct%x00%an%x00%ae%x00%P%x00%B%x00"
+
 
 class GitRepoInspector:
     def __init__(self, base_dir="repos"):
         self.base_dir = base_dir
         os.makedirs(self.base_dir, exist_ok=True)
+        # Default branch of each repository inspected so far
+        self._default_branches = {}
 
     def clone_repo(self, git_url: str) -> str:
         repo_name = git_url.rstrip("/").split("/")[-1].replace(".git", "")
@@ -20,19 +29,89 @@ class GitRepoInspector:
         Repo.clone_from(git_url, local_path)
         return local_path
 
+    @staticmethod
+    def _git(repo_path: str, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", repo_path, "-c", "core.quotePath=false", *args],
+            capture_output=True,
+            check=True,
+        ).stdout.decode("utf-8", errors="replace")
+
+    def _default_branch(self, repo_path: str) -> str:
+        key = os.path.abspath(repo_path)
+        branch = self._default_branches.get(key)
+        if branch is None:
+            try:
+                self._git(repo_path, "rev-parse", "--verify", "--quiet",
+                          "refs/heads/main")
+                branch = "main"
+            except subprocess.CalledProcessError:
+                branch = "master"
+            self._default_branches[key] = branch
+        return branch
+
+    def get_recent_commits(self,
+                           repo_path: str,
+                           commit_depth: int = 1) -> list:
+        """
+        Lists the most recent commits of the default branch, with the
+        files each one changes with respect to its first parent (or all
+        of its files, for the root commit).
+
+        All the commits are read with a single `git log` call, instead of
+        building a GitPython diff per commit; only merge commits, whose
+        files `git log` does not list, need a `git diff` call of their
+        own. Both calls work with any git version, and name the files
+        NUL-terminated, so that names containing newlines are kept.
+
+        Returns:
+        - list[dict]: One dict per commit, newest first, with the keys
+          `hexsha`, `committed_date`, `author_name`, `author_email`,
+          `parents`, `message` and `files`.
+        """
+        output = self._git(
+            repo_path,
+            "log",
+            f"--max-count={commit_depth}",
+            "--name-only",
+            "-z",
+            f"--pretty=format:{_LOG_FORMAT}",
+            self._default_branch(repo_path),
+            "--",
+        )
+
+        commits = []
+        for record in output.split(_COMMIT_SEP)[1:]:
+            (hexsha, committed_date, author_name, author_email,
+             parents, message, files) = record.split(_FIELD_SEP, 6)
+            parents = parents.split()
+            if len(parents) > 1:
+                files = self._git(
+                    repo_path, "diff", "--name-only", "-z",
+                    parents[0], hexsha, "--",
+                )
+            elif files.startswith("\n"):
+                # The file list starts after the newline ending the header
+                files = files[1:]
+            commits.append({
+                "hexsha": hexsha,
+                "committed_date": int(committed_date),
+                "author_name": author_name,
+                "author_email": author_email,
+                "parents": parents,
+                "message": message,
+                "files": [path for path in files.split(_FIELD_SEP) if path],
+            })
+        return commits
+
     def get_recently_modified_files(self,
                                     repo_path: str,
                                     commit_depth: int = 1) -> list:
-        repo = Repo(repo_path)
-        branch = "main" if "main" in repo.heads else "master"
-        commits = list(repo.iter_commits(branch, max_count=commit_depth))
         modified_files = set()
-        for commit in commits:
-            if commit.parents:
-                diffs = commit.diff(commit.parents[0])
-                for diff in diffs:
-                    path = diff.a_path or diff.b_path
-                    if path and path.endswith(".py"):
+        for commit in self.get_recent_commits(repo_path, commit_depth):
+            if commit["parents"]:
+                for path in commit["files"]:
+                    if path.endswith(".py"):
                         full_path = os.path.join(repo_path, path)
                         modified_files.add(full_path)
 
@@ -2,20 +2,152 @@ import os
 import ast
 import pandas as pd
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 from ..code_extractor.library_extractor import LibraryExtractor
 from ..code_extractor.model_extractor import ModelExtractor
 from ..code_extractor.dataframe_extractor import DataFrameExtractor
 from ..code_extractor.variable_extractor import VariableExtractor
 from .rule_checker import RuleChecker
 
-# Import lib2to3 for Python 2 parsing
-try:
-    from lib2to3 import pygram, pytree
-    from lib2to3.pgen2 import driver
-    from lib2to3.pgen2.parse import ParseError
-    HAS_LIB2TO3 = True
-except ImportError:
-    HAS_LIB2TO3 = False
+# Fields of each detected smell, in output order
+DETECTION_COLUMNS = [
+    "filename",
+    "function_name",
+    "smell_name",
+    "line",
+    "description",
+    "additional_info",
+]
+
+# Template of the result of a file without smells. It is built once and
+# handed out as shallow copies (see `empty_detections`).
+_EMPTY_DETECTIONS = pd.DataFrame(columns=DETECTION_COLUMNS)
+
+
+def empty_detections() -> pd.DataFrame:
+    """
+    Returns an empty DataFrame with the detection columns.
+    """
+    return _EMPTY_DETECTIONS.copy(deep=False)
+
+
+# Python 2 -> 3 syntax rewrites, compiled once at import time and applied
+# in order. Each one runs only if its marker substring is in the source.
+_PY2_PATTERNS = (
+    # Print statements -> print functions
+    (
+        "print",
+        re.compile(r'\bprint\s+([^(].*?)(?=\n|$)', re.MULTILINE),
+        r'print(\1)',
+    ),
+    # except Exception, e: -> except Exception as e:
+    (
+        "except",
+        re.compile(r'\bexcept\s+([^,]+),\s*([^:]+):'),
+        r'except \1 as \2:',
+    ),
+    # lambda (a, b): b -> lambda item: item[1]
+    (
+        "lambda",
+        re.compile(
+            r'lambda\s+\(\s*([^,)]+)\s*,\s*([^,)]+)\s*\)\s*:\s*\2\b'
+        ),
+        r'lambda item: item[1]',
+    ),
+    # lambda (a, b): a -> lambda item: item[0]
+    (
+        "lambda",
+        re.compile(
+            r'lambda\s+\(\s*([^,)]+)\s*,\s*([^,)]+)\s*\)\s*:\s*\1\b'
+        ),
+        r'lambda item: item[0]',
+    ),
+    # Any other lambda tuple unpacking: just remove the parentheses
+    ("lambda", re.compile(r'lambda\s+\(([^)]+)\)\s*:'), r'lambda \1:'),
+)
+
+# Python 2 names and idioms replaced verbatim by their Python 3 equivalent
+_PY2_LITERALS = {
+    "xrange(": "range(",
+    ".iteritems()": ".items()",
+    ".iterkeys()": ".keys()",
+    ".itervalues()": ".values()",
+    "import urllib2": "import urllib.request as urllib2",
+    "from urllib2": "from urllib.request",
+    "raw_input(": "input(",
+}
+# Matches every literal above, plus the u prefix of unicode strings, so
+# that all of them are rewritten in a single scan of the source
+_PY2_LITERAL_RE = re.compile(
+    "|".join(re.escape(literal) for literal in _PY2_LITERALS)
+    + r'|\bu(?=["\'])'
+)
+
+# A source needing any conversion contains at least one of these
+_PY2_MARKERS = (
+    "print",
+    "except",
+    "lambda",
+    "xrange(",
+    ".iter",
+    "urllib2",
+    "raw_input(",
+    'u"',
+    "u'",
+)
+
+# Number of parsed files an Inspector keeps in memory
+AST_MEMORY_CACHE_SIZE = 256
+
+
+# Inspector owned by the current worker process (see `_init_worker`).
+_worker_inspector = None
+
+
+def _init_worker(inspector_kwargs: dict) -> None:
+    """
+    Builds the Inspector of a worker process once, so the dictionary CSVs
+    are loaded a single time per process instead of once per file.
+    """
+    global _worker_inspector
+    _worker_inspector = Inspector(**inspector_kwargs)
+
+
+def _call_in_worker(function: Callable, item: Any) -> Any:
+    """Applies a function of `Inspector.map` in a worker process."""
+    return function(_worker_inspector, item)
+
+
+def inspect_safely(
+    inspector: "Inspector",
+    filename: str,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+) -> tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Inspects a file, returning the error instead of raising when it
+    cannot be analyzed. Suited as the function of `Inspector.map`.
+
+    Parameters:
+    - inspector (Inspector): The Inspector used for the file.
+    - filename (str): The file to be analyzed.
+    - exceptions (tuple): The exceptions reported as errors; any other
+      exception is raised.
+
+    Returns:
+    - tuple[Optional[pd.DataFrame], Optional[str]]: The code smells found
+      in the file, or the error raised if it could not be analyzed.
+    """
+    try:
+        return inspector.inspect(filename), None
+    except exceptions as e:
+        if inspector.debug:
+            print(f"Warning: Error analyzing {filename}: {e}")
+        return None, str(e)
 
 
 class Inspector:
@@ -44,11 +176,19 @@ class Inspector:
         """
         self.debug = debug
         self.output_path = output_path
+        # Enough to rebuild an equivalent Inspector in a worker process
+        self._init_kwargs = {
+            "output_path": output_path,
+            "dataframe_dict_path": dataframe_dict_path,
+            "model_dict_path": model_dict_path,
+            "tensor_dict_path": tensor_dict_path,
+            "debug": debug,
+        }
         self._setup(dataframe_dict_path, model_dict_path, tensor_dict_path)
-        
-        # Initialize Python 2 parser using lib2to3
-        if HAS_LIB2TO3:
-            self._init_lib2to3_parser()
+
+        # LRU cache of parsed files, keyed by (path, mtime, size)
+        self._ast_cache = OrderedDict()
+        self._ast_cache_lock = threading.Lock()
 
     def inspect(self, filename: str) -> pd.DataFrame:
         """
@@ -61,90 +201,109 @@ class Inspector:
         Returns:
         - pd.DataFrame: A DataFrame containing detected code smells.
         """
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
-        file_path = os.path.abspath(filename)
+        return self._inspect(filename, file_path=os.path.abspath(filename))
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                source = file.read()
+    def inspect_source(
+        self, source: Union[str, bytes], filename: str
+    ) -> pd.DataFrame:
+        """
+        Inspects source code that is already in memory, without reading
+        the file it comes from. The source may be given as the raw bytes
+        of the file, which are decoded as UTF-8.
 
-            # Parse the file into an AST with cascading fallback approach
-            tree = self._parse_with_cascading_fallback(source, filename)
-            lines = source.splitlines()
+        Parameters:
+        - source (Union[str, bytes]): The source code to analyze.
+        - filename (str): The filename reported for the detected smells.
+
+        Returns:
+        - pd.DataFrame: A DataFrame containing detected code smells.
+        """
+        return self._inspect(filename, source=source)
+
+    def _inspect(
+        self,
+        filename: str,
+        file_path: Optional[str] = None,
+        source: Optional[Union[str, bytes]] = None,
+    ) -> pd.DataFrame:
+        """
+        Parses either the given source or the file at `file_path` into an
+        AST, and applies the rules to it.
+        """
+        col = DETECTION_COLUMNS
+        detections = []
+
+        try:
+            if source is None:
+                # Parse the file, reusing the cached AST if unchanged
+                tree, lines = self._load_file(file_path, filename)
+            else:
+                if isinstance(source, bytes):
+                    source = source.decode("utf-8")
+                tree = self._parse_with_cascading_fallback(source, filename)
+                lines = source.splitlines()
 
             # Step 1: Extract Libraries
             libraries = self.library_extractor.get_library_aliases(
                 self.library_extractor.extract_libraries(tree)
             )
 
+            # Walk the tree once to collect the functions, in ast.walk
+            # order, and index the source lines by line number
+            # (lines_by_lineno[1] is line 1)
+            func_nodes = [
+                node for node in ast.walk(tree)
+                if isinstance(node, ast.FunctionDef)
+            ]
+            # The rules only run on functions
+            if not func_nodes:
+                return empty_detections()
+            lines_by_lineno = [""] + lines
+
             # Step 2: Analyze Functions and Extract Variables
-            variables_by_function = {}
-            dataframe_variables_by_function = {}
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_name = node.name
-                    variables_by_function[function_name] = (
-                        self.variable_extractor.extract_variable_definitions(
-                            node
-                        )
+            function_variables, function_dataframe_variables = (
+                self._extract_function_variables(func_nodes, libraries)
+            )
+
+            # Step 3: Gather the data shared by every function of the file
+            # (dictionaries are preloaded during setup)
+            file_data = {
+                "libraries": libraries,
+                "lines": lines_by_lineno,
+                "dataframe_methods": self.dataframe_extractor.df_methods,
+                "tensor_operations": self._tensor_operations,
+                "models": self._models,
+                "model_methods": self._model_methods,
+            }
+
+            # Step 4: Rule Check on Each Function, with the variables
+            # extracted from that same function (names may repeat, e.g.
+            # a method and a module-level function both called `forward`)
+            for node, variables, dataframe_variables in zip(
+                func_nodes,
+                function_variables,
+                function_dataframe_variables,
+            ):
+                try:
+                    function_data = {
+                        **file_data,
+                        # Walked once here, then shared by all the rules
+                        "nodes": list(ast.walk(node)),
+                        "variables": variables,
+                        "dataframe_variables": dataframe_variables,
+                    }
+
+                    # Pass data to the Rule Checker
+                    self.rule_checker.rule_check(
+                        node, function_data, filename, node.name, detections
                     )
-                    dataframe_variables_by_function[function_name] = (
-                        self.dataframe_extractor.extract_dataframe_variables(
-                            node, alias=libraries.get("pandas", None)
-                        )
+                except Exception as e:
+                    if self.debug:
+                        print(
+                        f"Error processing function '{node.name}' in file "
+                        f"'{filename}': {e}"
                     )
-
-            # Step 3: Load Dictionaries (preloaded during setup)
-            models = self.model_extractor.model_dict
-            tensor_operations = self.model_extractor.tensor_operations_dict
-            dataframe_methods = self.dataframe_extractor.df_methods
-
-            # Step 4: Rule Check on Each Function
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    try:
-                        function_data = {
-                            "libraries": libraries,
-                            "variables": variables_by_function[node.name],
-                            "lines": {
-                                n.lineno: lines[n.lineno - 1]
-                                for n in ast.walk(tree)
-                                if hasattr(n, "lineno")
-                            },
-                            "dataframe_methods": dataframe_methods,
-                            "dataframe_variables": (
-                                dataframe_variables_by_function[node.name]
-                            ),
-                            "tensor_operations": tensor_operations.get(
-                                "operation", []
-                            ),
-                            "models": {
-                                model: models[model] for model in models.keys()
-                            },
-                            "model_methods": (
-                                self.model_extractor.load_model_methods()
-                            ),
-                        }
-
-                        # Pass data to the Rule Checker
-                        to_save = self.rule_checker.rule_check(
-                            node, function_data, filename, node.name, to_save
-                        )
-                    except Exception as e:
-                        if self.debug:
-                            print(
-                            f"Error processing function '{node.name}' in file "
-                            f"'{filename}': {e}"
-                        )
-                        raise e
+                    raise e
 
         except FileNotFoundError as e:
             if self.debug:
@@ -159,20 +318,188 @@ class Inspector:
                 print(f"Unexpected error while analyzing file '{filename}': {e}")
             raise e
 
-        return to_save
+        if not detections:
+            return empty_detections()
+        return pd.DataFrame.from_records(detections, columns=col)
+
+    def inspect_many(
+        self, filenames: list[str], workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Inspects several files in parallel, one worker process per core
+        unless `workers` says otherwise (see `map`, which also falls back
+        to serial inspection). Files that cannot be analyzed are skipped.
+
+        Parameters:
+        - filenames (list[str]): The names of the files to analyze.
+        - workers (int, optional): The number of worker processes.
+
+        Returns:
+        - pd.DataFrame: A DataFrame containing the smells detected in
+          all files.
+        """
+        chunks = [
+            result
+            for result, _ in self.map(inspect_safely, filenames, workers)
+            if result is not None and not result.empty
+        ]
+        if not chunks:
+            return empty_detections()
+        return pd.concat(chunks, ignore_index=True)
+
+    def map(
+        self,
+        function: Callable[["Inspector", Any], Any],
+        items: Iterable,
+        workers: Optional[int] = None,
+    ) -> Iterator:
+        """
+        Applies `function(inspector, item)` to every item, and yields the
+        results in the order of `items`. This is the entry point for
+        running inspections in worker processes.
+
+        With more than one worker (one per core unless `workers` says
+        otherwise), the items are processed by a pool of processes. Each
+        process builds its own Inspector once, from the same dictionaries
+        as this one. `function` must then be defined at module level, so
+        that it can be sent to the workers.
+
+        If the pool cannot be started, or breaks, the remaining items are
+        processed serially with this Inspector. This happens, for
+        example, with the spawn start method (the default on macOS and
+        Windows) when the calling script has no
+        `if __name__ == "__main__":` guard.
+        Exceptions raised by `function` itself are propagated.
+
+        Parameters:
+        - function (Callable): Called with an Inspector and an item.
+        - items (Iterable): The items to process.
+        - workers (int, optional): The number of worker processes;
+          1 processes the items serially, in this process.
+
+        Returns:
+        - Iterator: The result of `function` for each item.
+        """
+        items = list(items)
+        workers = workers or os.cpu_count() or 1
+        done = 0
+
+        if workers > 1 and len(items) > 1:
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self._init_kwargs,),
+                )
+            except (OSError, NotImplementedError) as e:
+                print(f"Warning: Cannot start worker processes ({e}); "
+                      "inspecting serially.")
+                executor = None
+
+            if executor is not None:
+                chunksize = max(1, len(items) // (4 * workers))
+                try:
+                    with executor:
+                        for result in executor.map(
+                            partial(_call_in_worker, function),
+                            items,
+                            chunksize=chunksize,
+                        ):
+                            yield result
+                            done += 1
+                except BrokenProcessPool as e:
+                    print(f"Warning: Worker processes failed ({e}); "
+                          "inspecting the remaining items serially.")
+
+        for item in items[done:]:
+            yield function(self, item)
+
+    def _extract_function_variables(
+        self, func_nodes: list[ast.FunctionDef], libraries: dict[str, str]
+    ) -> tuple[list, list]:
+        """
+        Extracts the variable definitions and the DataFrame variables of
+        each function.
+
+        Only the PyTorch rules read the variable definitions, and only the
+        Pandas rules read the DataFrame variables: each extraction is
+        skipped, with empty results, in files not importing its library.
+
+        Parameters:
+        - func_nodes (list[ast.FunctionDef]): The functions to analyze.
+        - libraries (dict[str, str]): The library aliases of the file.
+
+        Returns:
+        - tuple[list, list]: The variable definitions and the DataFrame
+          variables of each function, in the order of `func_nodes`.
+        """
+        pandas_alias = libraries.get("pandas", None)
+
+        def extract_dataframe_variables(node):
+            if not pandas_alias:
+                return []
+            return self.dataframe_extractor.extract_dataframe_variables(
+                node, alias=pandas_alias
+            )
+
+        def extract_variables(node):
+            if not libraries.get("torch"):
+                return {}
+            return self.variable_extractor.extract_variable_definitions(node)
+
+        if not pandas_alias and not libraries.get("torch"):
+            return (
+                [{} for _ in func_nodes],
+                [[] for _ in func_nodes],
+            )
+
+        return (
+            [extract_variables(node) for node in func_nodes],
+            [extract_dataframe_variables(node) for node in func_nodes],
+        )
 
-    def _init_lib2to3_parser(self):
-        """Initialize the lib2to3 parser for Python 2 code."""
-        if HAS_LIB2TO3:
-            # Initialize the Python 2 grammar driver
-            self.py2_driver = driver.Driver(pygram.python_grammar, convert=pytree.convert)
+    def _load_file(
+        self, file_path: str, filename: str
+    ) -> tuple[ast.AST, list[str]]:
+        """
+        Reads and parses a file, unless it is unchanged since the last time
+        this Inspector parsed it: files are identified by path, modification
+        time and size, and the most recent ones are kept in memory.
+
+        Parameters:
+        - file_path (str): The absolute path of the file
+        - filename (str): The filename for context
+
+        Returns:
+        - tuple[ast.AST, list[str]]: The parsed AST tree and
+          the source code split by line
+        """
+        stat = os.stat(file_path)
+        cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+        with self._ast_cache_lock:
+            cached = self._ast_cache.get(cache_key)
+            if cached is not None:
+                self._ast_cache.move_to_end(cache_key)
+                return cached
+
+        with open(file_path, "rb") as file:
+            source = file.read().decode("utf-8")
+        parsed = (
+            self._parse_with_cascading_fallback(source, filename),
+            source.splitlines(),
+        )
+
+        with self._ast_cache_lock:
+            self._ast_cache[cache_key] = parsed
+            if len(self._ast_cache) > AST_MEMORY_CACHE_SIZE:
+                self._ast_cache.popitem(last=False)
+        return parsed
 
     def _parse_with_cascading_fallback(self, source: str, filename: str):
         """
         Parse source code with cascading fallback approach:
         1. Try Python 3 (ast.parse)
-        2. If fails, try Python 2 (lib2to3)
-        3. If fails, use syntax conversion fallback
+        2. If fails, convert Python 2 syntax and parse again
         
         Parameters:
         - source (str): The source code content
@@ -189,64 +516,24 @@ class Inspector:
         except SyntaxError as py3_error:
             if self.debug:
                 print(f"Python 3 parsing failed for {filename}: {py3_error}")
-            
-            # Step 2: Try lib2to3 for Python 2
-            if HAS_LIB2TO3:
-                try:
-                    if self.debug:
-                        print(f"Trying lib2to3 Python 2 parsing for {filename}")
-                    
-                    # Parse with lib2to3
-                    py2_tree = self.py2_driver.parse_string(source + '\n')
-                    
-                    # Convert lib2to3 parse tree to Python 3 compatible source
-                    python3_source = self._convert_lib2to3_tree_to_python3(py2_tree, source)
-                    
-                    # Parse the converted source with standard ast
-                    if self.debug:
-                        print(f"Successfully converted Python 2 to Python 3 for {filename}")
-                    return ast.parse(python3_source, filename=filename)
-                    
-                except ParseError as lib2to3_error:
-                    if self.debug:
-                        print(f"lib2to3 parsing failed for {filename}: {lib2to3_error}")
-                except Exception as lib2to3_error:
-                    if self.debug:
-                        print(f"lib2to3 conversion failed for {filename}: {lib2to3_error}")
-            else:
+
+            # Step 2: Use syntax conversion fallback. A source left
+            # unchanged would fail again with the same error.
+            source_converted = self._convert_python2_syntax(source)
+            if source_converted == source:
                 if self.debug:
-                    print(f"lib2to3 not available for {filename}")
-            
-            # Step 3: Use syntax conversion fallback
+                    print(f"No Python 2 syntax to convert in {filename}")
+                raise py3_error
             try:
                 if self.debug:
                     print(f"Using syntax conversion fallback for {filename}")
-                source_converted = self._convert_python2_syntax(source)
                 return ast.parse(source_converted, filename=filename)
-            except SyntaxError as fallback_error:
+            except SyntaxError:
                 if self.debug:
                     print(f"All parsing methods failed for {filename}")
                 # Re-raise the original Python 3 error for better debugging
                 raise py3_error
 
-    def _convert_lib2to3_tree_to_python3(self, py2_tree, original_source: str) -> str:
-        """
-        Convert lib2to3 parse tree to Python 3 compatible source code.
-        
-        For now, this is a simplified approach that uses basic regex conversion.
-        A full lib2to3 -> Python 3 converter would be quite complex.
-        
-        Parameters:
-        - py2_tree: Parse tree from lib2to3
-        - original_source: Original source code
-        
-        Returns:
-        - str: Python 3 compatible source code
-        """
-        # Since lib2to3 successfully parsed it as Python 2, we know it's valid Python 2
-        # Apply our conversion rules with confidence
-        return self._convert_python2_syntax(original_source)
-
     def _convert_python2_syntax(self, source: str) -> str:
         """
         Convert basic Python 2 syntax to Python 3 for AST parsing.
@@ -257,42 +544,18 @@ class Inspector:
         Returns:
         - str: Source code with basic Python 2 to 3 conversions
         """
-        # Convert print statements to print functions
-        # Handle various print statement formats
-        source = re.sub(r'\bprint\s+([^(].*?)(?=\n|$)', r'print(\1)', source, flags=re.MULTILINE)
-        
-        # Convert exception syntax: except Exception, e: -> except Exception as e:
-        source = re.sub(r'\bexcept\s+([^,]+),\s*([^:]+):', r'except \1 as \2:', source)
-        
-        # Convert lambda tuple unpacking - handle the specific case from the file
-        # lambda (a, b): b -> lambda item: item[1]
-        source = re.sub(r'lambda\s+\(\s*([^,)]+)\s*,\s*([^,)]+)\s*\)\s*:\s*\2\b', 
-                       r'lambda item: item[1]', source)
-        source = re.sub(r'lambda\s+\(\s*([^,)]+)\s*,\s*([^,)]+)\s*\)\s*:\s*\1\b', 
-                       r'lambda item: item[0]', source)
-        
-        # More general lambda tuple unpacking removal (just remove parentheses)
-        source = re.sub(r'lambda\s+\(([^)]+)\)\s*:', r'lambda \1:', source)
-        
-        # Convert xrange to range
-        source = source.replace('xrange(', 'range(')
-        
-        # Convert dict iteration methods
-        source = source.replace('.iteritems()', '.items()')
-        source = source.replace('.iterkeys()', '.keys()')
-        source = source.replace('.itervalues()', '.values()')
-        
-        # Handle unicode literals - remove u prefix
-        source = re.sub(r'\bu(["\'])', r'\1', source)
-        
-        # Convert urllib2 to urllib (basic conversion for parsing)
-        source = source.replace('import urllib2', 'import urllib.request as urllib2')
-        source = source.replace('from urllib2', 'from urllib.request')
-        
-        # Handle raw_input -> input (though this might not be needed for AST parsing)
-        source = source.replace('raw_input(', 'input(')
-        
-        return source
+        if not any(marker in source for marker in _PY2_MARKERS):
+            return source
+
+        for marker, pattern, replacement in _PY2_PATTERNS:
+            if marker in source:
+                source = pattern.sub(replacement, source)
+
+        # The u prefix is the only match missing from _PY2_LITERALS:
+        # it is replaced by the empty string
+        return _PY2_LITERAL_RE.sub(
+            lambda match: _PY2_LITERALS.get(match.group(0), ""), source
+        )
 
     def _setup(
         self,
@@ -324,4 +587,11 @@ class Inspector:
         # Preload dictionaries to avoid runtime errors
         self.model_extractor.load_model_dict()
         self.model_extractor.load_tensor_operations_dict()
-        self.dataframe_extractor.load_dataframe_dict(dataframe_dict_path)
\ No newline at end of file
+        self.dataframe_extractor.load_dataframe_dict(dataframe_dict_path)
+
+        # Dictionary views shared by every function of every inspected file
+        self._models = dict(self.model_extractor.model_dict)
+        self._model_methods = self.model_extractor.load_model_methods()
+        self._tensor_operations = (
+            self.model_extractor.tensor_operations_dict.get("operation", [])
+        )
\ No newline at end of file
@@ -1,15 +1,118 @@
 import datetime
+import hashlib
+import json
 import os
 import time
-import threading
+from contextlib import ExitStack
+from functools import lru_cache, partial
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
-from git import Repo, NULL_TREE
-from .inspector import Inspector
+from typing import Optional
+from .inspector import (
+    DETECTION_COLUMNS,
+    Inspector,
+    empty_detections,
+    inspect_safely,
+)
 from ..utils.file_utils import FileUtils
 from .git_repo_inspector import GitRepoInspector
 
 
+# Columns of the cached results of a file: the filename is filled in when
+# they are read back, as the file may be named by another path
+_CACHED_COLUMNS = [
+    column for column in DETECTION_COLUMNS if column != "filename"
+]
+
+# Errors of a file that are logged to error.txt; any other error fails the
+# analysis of its project
+_FILE_ERRORS = (SyntaxError, FileNotFoundError)
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """
+    Hashes the source files of the codesmile package, so that cached
+    results are discarded as soon as any detection code changes.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, package_dir).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _inspect_files(
+    inspector: Inspector,
+    filenames: list[str],
+    workers: int = 1,
+) -> tuple[pd.DataFrame, list[tuple[str, str]]]:
+    """
+    Inspects the given files, collecting their results in a list that is
+    concatenated once at the end.
+
+    Parameters:
+    - inspector (Inspector): The Inspector used for every file.
+    - filenames (list[str]): The files to be analyzed.
+    - workers (int): Number of worker processes (see `Inspector.map`).
+
+    Returns:
+    - tuple[pd.DataFrame, list[tuple[str, str]]]: The code smells found in
+      the files, and the (filename, error) pairs of the files that
+      could not be analyzed.
+    """
+    results = inspector.map(
+        partial(inspect_safely, exceptions=_FILE_ERRORS), filenames, workers
+    )
+
+    frames = []
+    errors = []
+
+    for filename, (result, error) in zip(filenames, results):
+        if error is not None:
+            errors.append((filename, error))
+            continue
+
+        smell_count = len(result)
+        if smell_count > 0:
+            print(f"Found {smell_count} code smells in file: {filename}")
+            frames.append(result)
+
+    if not frames:
+        return empty_detections(), errors
+    return pd.concat(frames, ignore_index=True), errors
+
+
+def _inspect_project(
+    inspector: Inspector, project_path: str
+) -> tuple[
+    Optional[tuple[pd.DataFrame, list[tuple[str, str]]]], Optional[str]
+]:
+    """
+    Inspects every Python file of a project.
+
+    Parameters:
+    - inspector (Inspector): The Inspector used for every file.
+    - project_path (str): Path to the project to be analyzed.
+
+    Returns:
+    - tuple[Optional[tuple[pd.DataFrame, list[tuple[str, str]]]],
+      Optional[str]]: The results of `_inspect_files` for the project, or
+      the error raised if it could not be analyzed.
+    """
+    try:
+        return _inspect_files(
+            inspector, FileUtils.get_python_files(project_path)
+        ), None
+    except Exception as e:
+        return None, str(e)
+
+
 class ProjectAnalyzer:
     """
     Handles the analysis of Python projects
@@ -27,6 +130,8 @@ class ProjectAnalyzer:
         self.output_path = os.path.join(output_path, "output")
 
         FileUtils.clean_directory(self.base_output_path, "output")
+        # Directories known to exist under the output folder
+        self._output_dirs = {self.output_path}
 
         self.inspector = Inspector(self.output_path)
         self.git_inspector = GitRepoInspector()
@@ -36,6 +141,23 @@ class ProjectAnalyzer:
         Cleans or creates the output directory for analysis results.
         """
         FileUtils.clean_directory(self.base_output_path, "output")
+        self._output_dirs = {self.output_path}
+
+    def _ensure_output_dir(self, path: str) -> str:
+        """
+        Creates a directory under the output folder, unless it was
+        already created since the folder was last cleaned.
+
+        Parameters:
+        - path (str): The directory to create.
+
+        Returns:
+        - str: The directory.
+        """
+        if path not in self._output_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._output_dirs.add(path)
+        return path
 
     def _save_results(
             self,
@@ -55,21 +177,61 @@ class ProjectAnalyzer:
             return
 
         if subdir:
-            os.makedirs(os.path.join(self.output_path, subdir), exist_ok=True)
-            file_path = os.path.join(self.output_path, subdir, filename)
+            output_dir = os.path.join(self.output_path, subdir)
         else:
-            os.makedirs(self.output_path, exist_ok=True)
-            file_path = os.path.join(self.output_path, filename)
+            output_dir = self.output_path
+        file_path = os.path.join(self._ensure_output_dir(output_dir), filename)
 
         df.to_csv(file_path, index=False)
         print(f"Results saved to {file_path}")
 
-    def analyze_project(self, project_path: str) -> int:
+    @staticmethod
+    def _list_projects(base_path: str) -> list[os.DirEntry]:
+        """
+        Lists the project directories in a base directory, skipping the
+        output folder. A single os.scandir pass is used: its entries cache
+        the file type read along with the directory, so telling projects
+        apart from files needs no stat call per entry.
+
+        Parameters:
+        - base_path (str): Directory containing the projects.
+
+        Returns:
+        - list[os.DirEntry]: The entries of the project directories.
+        """
+        with os.scandir(base_path) as entries:
+            return [
+                entry for entry in entries
+                if entry.name != "output" and entry.is_dir()
+            ]
+
+    def _log_errors(self, errors: list[tuple[str, str]]):
+        """
+        Appends the errors of the files that could not be analyzed to
+        error.txt in the output root folder.
+
+        Parameters:
+        - errors (list[tuple[str, str]]): The (filename, error) pairs.
+        """
+        if not errors:
+            return
+
+        error_file = os.path.join(
+            self._ensure_output_dir(self.output_path), "error.txt"
+        )
+        with open(error_file, "a") as f:
+            for filename, error in errors:
+                f.write(f"Error in file {filename}: {error}\n")
+                print(f"Error analyzing file: {filename} - {error}")
+
+    def analyze_project(self, project_path: str, workers: int = 1) -> int:
         """
         Analyzes a single project for code smells.
 
         Parameters:
         - project_path (str): Path to the project to be analyzed.
+        - workers (int): Number of worker processes to inspect the files
+          with; the default of 1 inspects them in this process.
 
         Returns:
         - int: Total number of code smells found in the project.
@@ -83,35 +245,9 @@ class ProjectAnalyzer:
             raise ValueError(f"The project '"
                              f"{project_path}"
                              f"' contains no Python files.")
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
-        total_smells = 0
-
-        for filename in filenames:
-            try:
-                result = self.inspector.inspect(filename)
-
-                smell_count = len(result)
-                total_smells += smell_count
-                if smell_count > 0:
-                    print(
-                        f"Found {smell_count} code smells in file: {filename}"
-                    )
-                to_save = pd.concat([to_save, result], ignore_index=True)
-            except (SyntaxError, FileNotFoundError) as e:
-                error_file = os.path.join(self.output_path, "error.txt")
-                os.makedirs(self.output_path, exist_ok=True)
-                with open(error_file, "a") as f:
-                    f.write(f"Error in file {filename}: {str(e)}\n")
-                print(f"Error analyzing file: {filename} - {str(e)}")
-                continue
+        to_save, errors = _inspect_files(self.inspector, filenames, workers)
+        self._log_errors(errors)
+        total_smells = len(to_save)
 
         self._save_results(to_save, "overview.csv")
         self._save_results(
@@ -152,56 +288,20 @@ class ProjectAnalyzer:
         start_time = time.time()
         total_smells = 0
 
-        for dirname in os.listdir(base_path):
-            if dirname in {"output", "execution_log.txt"}:
-                continue
-
+        for entry in self._list_projects(base_path):
+            dirname = entry.name
             if resume and dirname <= last_project:
                 continue
 
-            project_path = os.path.join(base_path, dirname)
-
-            if not os.path.isdir(project_path):
-                continue
+            project_path = entry.path
 
             print(f"Analyzing project '{dirname}' sequentially...")
             try:
                 filenames = FileUtils.get_python_files(project_path)
 
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-
-                for filename in filenames:
-                    try:
-                        result = self.inspector.inspect(filename)
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
-                        )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
-                        )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
-                        continue
+                to_save, errors = _inspect_files(self.inspector, filenames)
+                self._log_errors(errors)
+                project_smells = len(to_save)
 
                 if not to_save.empty:
                     self._save_results(
@@ -232,9 +332,16 @@ class ProjectAnalyzer:
         """
         Analyzes multiple projects in parallel.
 
+        Each project is inspected in a worker process, with an Inspector
+        of its own: the AST analysis is pure-Python CPU work, which
+        threads cannot run in parallel. Results, errors and the execution
+        log are written by this process, in project order. If the worker
+        processes fail, the remaining projects are analyzed serially (see
+        `Inspector.map`).
+
         Parameters:
         - base_path (str): Directory containing projects to be analyzed.
-        - max_workers (int): Maximum number of parallel threads.
+        - max_workers (int): Maximum number of worker processes.
         """
         execution_log_path = os.path.join(base_path, "execution_log.txt")
         if not os.path.exists(base_path):
@@ -245,74 +352,30 @@ class ProjectAnalyzer:
 
         start_time = time.time()
         total_smells = 0
-        lock = threading.Lock()  # Thread-safe lock for logging
-
-        def analyze_and_count_smells(dirname: str):
-            nonlocal total_smells
-            project_path = os.path.join(base_path, dirname)
-            if dirname in {"output", "execution_log.txt"} or not os.path.isdir(
-                project_path
-            ):
-                return
-
-            print(f"Analyzing project '{dirname}' in parallel...")
-            try:
-                filenames = FileUtils.get_python_files(project_path)
-
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-
-                for filename in filenames:
-                    try:
-                        result = self.inspector.inspect(filename)
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
-                        )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
-                        )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
-                        continue
-
-                if not to_save.empty:
-                    self._save_results(
-                        to_save,
-                        f"{dirname}_results.csv",
-                        subdir="project_details")
 
-                total_smells += project_smells
+        entries = self._list_projects(base_path)
+        for entry in entries:
+            print(f"Analyzing project '{entry.name}' in parallel...")
 
-                # Thread-safe log update
-                FileUtils.synchronized_append_to_log(
-                    execution_log_path, dirname, lock
-                )
+        results = self.inspector.map(
+            _inspect_project, [entry.path for entry in entries], max_workers
+        )
+        for entry, (result, error) in zip(entries, results):
+            dirname = entry.name
+            if error is not None:
+                print(f"Error analyzing project '{dirname}': {error}\n")
+                continue
 
-            except Exception as e:
-                print(f"Error analyzing project '{dirname}': {str(e)}\n")
+            to_save, errors = result
+            self._log_errors(errors)
+            if not to_save.empty:
+                self._save_results(
+                    to_save,
+                    f"{dirname}_results.csv",
+                    subdir="project_details")
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for dirname in os.listdir(base_path):
-                executor.submit(analyze_and_count_smells, dirname)
+            total_smells += len(to_save)
+            FileUtils.append_to_log(execution_log_path, dirname)
 
         self.merge_all_results()
 
@@ -327,77 +390,219 @@ class ProjectAnalyzer:
                              commit_depth: int = 1) -> int:
         print(f"🔍 Quick Scan temporale attivo per: {repo_path}")
 
-        repo = Repo(repo_path)
-        branch = "main" if "main" in repo.heads else "master"
-        commits = list(repo.iter_commits(branch, max_count=commit_depth))
+        commits = self.git_inspector.get_recent_commits(
+            repo_path, commit_depth
+        )
 
         total_smells = 0
-        all_results = []
-
-        for i, commit in enumerate(commits):
-            commit_hash = commit.hexsha
-            commit_date = (datetime
-                           .datetime
-                           .fromtimestamp(commit.committed_date)
-                           .isoformat())
-            commit_author = f"{commit.author.name} <{commit.author.email}>"
-            commit_msg = commit.message.strip()
-
-            # Recupera file modificati nel commit
-            if not commit.parents:
-                diffs = commit.diff(NULL_TREE)  # primo commit
-            else:
-                diffs = commit.diff(commit.parents[0])
-
-            modified_files = [
-                diff.a_path or diff.b_path
-                for diff in diffs
-                if (diff.a_path or diff.b_path).endswith(".py")
-            ]
+        results_path = os.path.join(
+            self.output_path, "project_details", "quickscan_results.csv"
+        )
+        results_file = None
+
+        # Results of unchanged files are reused across runs, and the
+        # results are appended to the CSV as soon as each file is analyzed
+        dictionaries = self._dictionaries_stamp()
+        cache_path = os.path.join(
+            self.base_output_path, ".cache", "results.json"
+        )
+        result_cache = self._load_result_cache(cache_path)
+        with ExitStack() as stack:
+            for i, commit in enumerate(commits):
+                commit_hash = commit["hexsha"]
+                commit_date = (datetime
+                               .datetime
+                               .fromtimestamp(commit["committed_date"])
+                               .isoformat())
+                commit_author = (
+                    f"{commit['author_name']} <{commit['author_email']}>"
+                )
+                commit_msg = commit["message"].strip()
+
+                # File modificati nel commit (tutti, per il primo commit)
+                modified_files = [
+                    path for path in commit["files"] if path.endswith(".py")
+                ]
+
+                for file_rel_path in modified_files:
+                    abs_path = os.path.join(repo_path, file_rel_path)
+                    if not os.path.isfile(abs_path):
+                        continue  # escludi file rimossi o spostati
+
+                    try:
+                        result = self._inspect_cached(
+                            abs_path, result_cache, dictionaries
+                        )
+                        if result.empty:
+                            continue
+
+                        smell_count = len(result)
+                        total_smells += smell_count
+
+                        write_header = results_file is None
+                        if write_header:
+                            self._ensure_output_dir(
+                                os.path.dirname(results_path)
+                            )
+                            results_file = stack.enter_context(
+                                open(results_path, "w", newline="")
+                            )
+                        result.assign(
+                            commit_index=i + 1,
+                            commit_hash=commit_hash,
+                            commit_date=commit_date,
+                            commit_author=commit_author,
+                            commit_msg=commit_msg,
+                            relative_file=file_rel_path,
+                            project_path=repo_path,
+                        ).to_csv(
+                            results_file, header=write_header, index=False
+                        )
+
+                        print(f"✅ [{commit_hash[:7]}] "
+                              f"{file_rel_path}: "
+                              f"{smell_count} smells")
+
+                    except Exception as e:
+                        print(f"❌ Errore su "
+                              f"{file_rel_path} @ "
+                              f"{commit_hash[:7]}: {e}")
 
-            for file_rel_path in modified_files:
-                abs_path = os.path.join(repo_path, file_rel_path)
-                if not os.path.isfile(abs_path):
-                    continue  # escludi file rimossi o spostati
-
-                try:
-                    result = self.inspector.inspect(abs_path)
-                    if result.empty:
-                        continue
-
-                    smell_count = len(result)
-                    total_smells += smell_count
-
-                    result["commit_index"] = i + 1
-                    result["commit_hash"] = commit_hash
-                    result["commit_date"] = commit_date
-                    result["commit_author"] = commit_author
-                    result["commit_msg"] = commit_msg
-                    result["relative_file"] = file_rel_path
-                    result["project_path"] = repo_path
-
-                    all_results.append(result)
-
-                    print(f"✅ [{commit_hash[:7]}] "
-                          f"{file_rel_path}: "
-                          f"{smell_count} smells")
-
-                except Exception as e:
-                    print(f"❌ Errore su "
-                          f"{file_rel_path} @ "
-                          f"{commit_hash[:7]}: {e}")
-
-        if all_results:
-            to_save = pd.concat(all_results, ignore_index=True)
-            self._save_results(
-                to_save,
-                "quickscan_results.csv",
-                subdir="project_details")
+        self._prune_result_cache(result_cache, dictionaries)
+        self._save_result_cache(cache_path, result_cache)
+
+        if results_file is not None:
+            print(f"Results saved to {results_path}")
 
         self.merge_all_results()
 
         return total_smells
 
+    def _dictionaries_stamp(self) -> list:
+        """
+        Identifies the current version of the Inspector's dictionary CSVs.
+
+        Returns:
+        - list: The [path, modification time] pair of each dictionary,
+          with None as the time of a missing dictionary.
+        """
+        stamp = []
+        for name in ("dataframe_dict_path", "model_dict_path",
+                     "tensor_dict_path"):
+            path = os.path.abspath(self.inspector._init_kwargs[name])
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            stamp.append([path, mtime])
+        return stamp
+
+    @staticmethod
+    def _cache_stamp(file_path: str, dictionaries: list) -> Optional[list]:
+        """
+        Identifies the version of a file whose results are cached.
+
+        Parameters:
+        - file_path (str): Path to the analyzed file.
+        - dictionaries (list): See `_dictionaries_stamp`.
+
+        Returns:
+        - Optional[list]: The fingerprint of the codesmile sources, the
+          dictionaries and the file's modification time and size, or None
+          if the file is gone.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return [
+            _code_fingerprint(), dictionaries, stat.st_mtime_ns, stat.st_size
+        ]
+
+    @staticmethod
+    def _load_result_cache(cache_path: str) -> dict:
+        """
+        Reads the cached results of previous quick scans.
+
+        Parameters:
+        - cache_path (str): Path to the JSON cache file.
+
+        Returns:
+        - dict: The cache, empty if the file is missing or unreadable.
+        """
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                result_cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return result_cache if isinstance(result_cache, dict) else {}
+
+    @staticmethod
+    def _save_result_cache(cache_path: str, result_cache: dict):
+        """
+        Writes the cached results, replacing the cache file at once so
+        that an interrupted write cannot leave it truncated.
+
+        Parameters:
+        - cache_path (str): Path to the JSON cache file.
+        - result_cache (dict): See `_inspect_cached`.
+        """
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(result_cache, f)
+        os.replace(temp_path, cache_path)
+
+    def _inspect_cached(
+        self, file_path: str, result_cache: dict, dictionaries: list
+    ) -> pd.DataFrame:
+        """
+        Inspects a file, unless the cache holds its results for the same
+        file version, dictionaries and codesmile sources.
+
+        Parameters:
+        - file_path (str): Path to the file to be analyzed.
+        - result_cache (dict): Maps absolute file paths to their stamp
+          (see `_cache_stamp`) and result rows, without the filename.
+        - dictionaries (list): See `_dictionaries_stamp`.
+
+        Returns:
+        - pd.DataFrame: The code smells found in the file.
+        """
+        key = os.path.abspath(file_path)
+        stamp = self._cache_stamp(key, dictionaries)
+        entry = result_cache.get(key)
+        if isinstance(entry, dict) and entry.get("stamp") == stamp:
+            if not entry["rows"]:
+                return empty_detections()
+            return pd.DataFrame(
+                [[file_path, *row] for row in entry["rows"]],
+                columns=DETECTION_COLUMNS,
+            )
+
+        result = self.inspector.inspect(file_path)
+        result_cache[key] = {
+            "stamp": stamp,
+            "rows": result[_CACHED_COLUMNS].values.tolist(),
+        }
+        return result
+
+    def _prune_result_cache(self, result_cache: dict, dictionaries: list):
+        """
+        Drops the cached results of files that were removed or changed,
+        or that were analyzed with other dictionaries or codesmile sources.
+
+        Parameters:
+        - result_cache (dict): See `_inspect_cached`.
+        - dictionaries (list): See `_dictionaries_stamp`.
+        """
+        for key in list(result_cache):
+            stamp = self._cache_stamp(key, dictionaries)
+            entry = result_cache[key]
+            if (stamp is None or not isinstance(entry, dict)
+                    or entry.get("stamp") != stamp):
+                del result_cache[key]
+
     def merge_all_results(self):
         """
         Merges all CSV result files from multiple
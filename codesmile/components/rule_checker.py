@@ -1,4 +1,3 @@
-import pandas as pd
 import ast
 from ..detection_rules.api_specific import (
     chain_indexing_smell,
@@ -44,8 +43,8 @@ class RuleChecker:
         extracted_data: dict[str, any],
         filename: str,
         function_name: str,
-        df_output: pd.DataFrame,
-    ) -> pd.DataFrame:
+        detections: list[tuple],
+    ) -> list[tuple]:
         """
         Applies all registered smell detectors to the given AST node.
 
@@ -55,23 +54,28 @@ class RuleChecker:
         (e.g., libraries, variables, etc.).
         - filename (str): The name of the file being analyzed.
         - function_name (str): The name of the function node being analyzed.
-        - df_output (pd.DataFrame): The DataFrame to store detected smells.
+        - detections (list[tuple]): The list to store detected smells in.
+          Each smell is appended as a tuple of
+          (filename, function_name, smell_name, line,
+          description, additional_info).
 
         Returns:
-        - pd.DataFrame: The updated DataFrame containing detected smells.
+        - list[tuple]: The updated list containing detected smells.
         """
         for smell in self.smells:
             try:
                 detected_smells = smell.detect(ast_node, extracted_data)
                 for detected_smell in detected_smells:
-                    df_output.loc[len(df_output)] = {
-                        "filename": filename,
-                        "function_name": function_name,
-                        "smell_name": detected_smell["name"],
-                        "line": detected_smell["line"],
-                        "description": detected_smell["description"],
-                        "additional_info": detected_smell["additional_info"],
-                    }
+                    detections.append(
+                        (
+                            filename,
+                            function_name,
+                            detected_smell["name"],
+                            detected_smell["line"],
+                            detected_smell["description"],
+                            detected_smell["additional_info"],
+                        )
+                    )
             except Exception as e:
                 print(
                     f"Error in rule checker '{type(smell).__name__}' "
@@ -79,7 +83,7 @@ class RuleChecker:
                     f"in file '{filename}': {e}"
                 )
 
-        return df_output
+        return detections
 
     def _setup_smells(self) -> None:
         """
@@ -32,7 +32,7 @@ class ChainIndexingSmell(Smell):
         dataframe_variables = extracted_data["dataframe_variables"]
 
         # Traverse the entire AST
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             # Check if the node is a chained indexing
             if (
                 isinstance(node, ast.Subscript)
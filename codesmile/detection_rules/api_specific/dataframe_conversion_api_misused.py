@@ -34,10 +34,10 @@ class DataFrameConversionAPIMisused(Smell):
             return smells
 
         dataframe_variables = extracted_data.get("dataframe_variables", [])
-        lines = extracted_data.get("lines", {})
+        lines = extracted_data.get("lines", [])
 
         # Traverse the AST
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Attribute)
                 and node.attr == "values"  # Check for the `values` attribute
@@ -45,7 +45,7 @@ class DataFrameConversionAPIMisused(Smell):
                 and node.value.id in dataframe_variables
             ):
                 # Extract the offending line for additional context
-                code_snippet = lines.get(node.lineno, "<Code not available>")
+                code_snippet = self.get_code_snippet(lines, node.lineno)
                 smells.append(
                     self.format_smell(
                         line=node.lineno,
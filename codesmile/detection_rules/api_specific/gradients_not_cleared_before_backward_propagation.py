@@ -35,12 +35,12 @@ class GradientsNotClearedSmell(Smell):
         if not torch_alias:
             return smells
 
-        lines = extracted_data.get("lines", {})
+        lines = extracted_data.get("lines", [])
 
         variables = extracted_data["variables"]
 
         # Traverse the AST to detect improper usage of gradients
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(
                 node, (ast.For, ast.While)
             ):  # Look for loops (for/while)
@@ -67,8 +67,8 @@ class GradientsNotClearedSmell(Smell):
                             and not zero_grad_called
                         ):
                             # Extract the offending line for additional context
-                            code_snippet = lines.get(
-                                subnode.lineno, "<Code not available>"
+                            code_snippet = self.get_code_snippet(
+                                lines, subnode.lineno
                             )
                             smells.append(
                                 self.format_smell(
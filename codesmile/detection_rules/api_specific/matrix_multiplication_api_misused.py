@@ -32,9 +32,9 @@ class MatrixMultiplicationAPIMisused(Smell):
         if not numpy_alias:
             return smells
 
-        lines = extracted_data.get("lines", {})
+        lines = extracted_data.get("lines", [])
 
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Call) and isinstance(
                 node.func, ast.Attribute
             ):
@@ -46,8 +46,8 @@ class MatrixMultiplicationAPIMisused(Smell):
                 ):
                     # Check if the `dot()` call arguments involve matrices
                     if self._is_matrix_multiplication(node):
-                        code_snippet = lines.get(
-                            node.lineno, "<Code not available>"
+                        code_snippet = self.get_code_snippet(
+                            lines, node.lineno
                         )
                         smells.append(
                             self.format_smell(
@@ -32,9 +32,10 @@ class PyTorchCallMethodMisusedSmell(Smell):
         if not torch_aliases:
             return smells
 
-        variable_names = set(extracted_data["variables"].keys())
+        # Membership is checked on the dict itself, without copying its keys
+        variable_names = extracted_data["variables"]
 
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and isinstance(node.func, ast.Attribute)
@@ -69,7 +70,8 @@ class PyTorchCallMethodMisusedSmell(Smell):
 
     def _get_base_name(self, node):
         """
-        Recursively finds the base name for an `ast.Attribute` node.
+        Finds the base name for an `ast.Attribute` node, following
+        the chain of attributes down to its root.
 
         Parameters:
         - node (ast.AST): The node to analyze.
@@ -77,8 +79,8 @@ class PyTorchCallMethodMisusedSmell(Smell):
         Returns:
         - str: The base name if found, otherwise None.
         """
+        while isinstance(node, ast.Attribute):
+            node = node.value
         if isinstance(node, ast.Name):
             return node.id
-        elif isinstance(node, ast.Attribute):
-            return self._get_base_name(node.value)
         return None
@@ -32,7 +32,7 @@ class TensorArrayNotUsedSmell(Smell):
         # Track tensor variables initialized with `tf.constant`
         tensor_constants = set()
         # First Pass: Detect `tf.constant` assignments and track the variable
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Assign) and isinstance(
                 node.value, ast.Call
             ):
@@ -47,7 +47,7 @@ class TensorArrayNotUsedSmell(Smell):
                             tensor_constants.add(target.id)
 
         # Second Pass: Check if the tracked tensor is modified inside a loop
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Assign) and isinstance(
                 node.value, ast.Call
             ):
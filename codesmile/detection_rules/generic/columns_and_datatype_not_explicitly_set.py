@@ -37,7 +37,7 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
             return smells
 
         # Traverse AST to find calls to DataFrame or read_csv
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and hasattr(node.func, "attr")
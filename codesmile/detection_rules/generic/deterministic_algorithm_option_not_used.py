@@ -36,7 +36,7 @@ class DeterministicAlgorithmOptionSmell(Smell):
         libraries = extracted_data.get("libraries", {})
 
         # Traverse AST to detect calls to `use_deterministic_algorithms`
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Call):
                 # Extract the full function name
                 func_name = self._get_full_function_name(node.func, libraries)
@@ -42,7 +42,7 @@ class EmptyColumnMisinitializationSmell(Smell):
             dataframe_variables = []
 
         # Traversing AST nodes to detect smells
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Assign)  # An assignment statement
                 and len(node.targets) == 1  # Single assignment target
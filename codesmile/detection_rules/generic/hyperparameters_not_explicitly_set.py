@@ -42,7 +42,7 @@ class HyperparametersNotExplicitlySetSmell(Smell):
         ]
 
         # Traverse AST to find calls to model definitions
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Call):
                 # Extract the full function name
                 func_name = self._get_full_function_name(node.func, libraries)
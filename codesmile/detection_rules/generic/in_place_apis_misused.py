@@ -43,7 +43,7 @@ class InPlaceAPIsMisusedSmell(Smell):
         dataframe_methods = extracted_data.get("dataframe_methods", [])
 
         # Traverse AST nodes
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             # Identify calls like `df.method(...)`
             if (
                 isinstance(node, ast.Call)
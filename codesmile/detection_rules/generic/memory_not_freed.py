@@ -45,7 +45,7 @@ class MemoryNotFreedSmell(Smell):
         # Identify loops in the AST
         loop_nodes = [
             node
-            for node in ast.walk(ast_node)
+            for node in self.walk(ast_node, extracted_data)
             if isinstance(node, (ast.For, ast.While))
         ]
 
@@ -1,6 +1,9 @@
 import ast
 from ..smell import Smell
 
+# Parameters that every `merge` call should set explicitly
+REQUIRED_MERGE_ARGS = frozenset({"how", "on", "validate"})
+
 
 class MergeAPIParameterNotExplicitlySetSmell(Smell):
     """
@@ -38,7 +41,7 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
         dataframe_variables = extracted_data.get("dataframe_variables", [])
 
         # Traverse AST nodes to find calls to `merge`
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and hasattr(node.func, "attr")
@@ -81,8 +84,7 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
                             if isinstance(kw, ast.keyword)
                             and kw.arg is not None
                         ]
-                        required_args = {"how", "on", "validate"}
-                        if not required_args.issubset(set(valid_keywords)):
+                        if not REQUIRED_MERGE_ARGS.issubset(valid_keywords):
                             smells.append(
                                 self.format_smell(
                                     line=node.lineno,
@@ -37,7 +37,7 @@ class NanEquivalenceComparisonMisusedSmell(Smell):
             return smells
 
         # Traverse AST nodes
-        for node in ast.walk(ast_node):
+        for node in self.walk(ast_node, extracted_data):
             if isinstance(node, ast.Compare):
                 # Check if NaN is misused in equivalence comparison
                 if self._has_nan_comparison(node, library_name):
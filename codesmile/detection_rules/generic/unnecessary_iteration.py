@@ -2,6 +2,11 @@ import ast
 from typing import Optional
 from ..smell import Smell
 
+# Pandas methods that iterate over a DataFrame row by row
+INEFFICIENT_METHODS = frozenset(
+    {"iterrows", "itertuples", "apply", "applymap"}
+)
+
 
 class UnnecessaryIterationSmell(Smell):
     """
@@ -45,11 +50,11 @@ class UnnecessaryIterationSmell(Smell):
         dataframe_variables = set(
             extracted_data.get("dataframe_variables", [])
         )
-        inefficient_methods = {"iterrows", "itertuples", "apply", "applymap"}
+        inefficient_methods = INEFFICIENT_METHODS
 
         loop_nodes = [
             node
-            for node in ast.walk(ast_node)
+            for node in self.walk(ast_node, extracted_data)
             if isinstance(node, (ast.For, ast.While))
         ]
 
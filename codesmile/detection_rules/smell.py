@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 import ast
 
 
@@ -47,13 +48,14 @@ class Smell(ABC):
                 "df": <Assign AST node>,
                 "model": <Assign AST node>
             }
-        - `lines` (dict[int, str]): Maps line numbers to
-           the corresponding source code.
+        - `lines` (list[str]): The source code of the file,
+           indexed by line number (index 0 is unused).
             Example:
-            {
-                1: "import pandas as pd",
-                2: "df = pd.DataFrame({'a': [1, 2, 3]})"
-            }
+            [
+                "",
+                "import pandas as pd",
+                "df = pd.DataFrame({'a': [1, 2, 3]})"
+            ]
         - `dataframe_methods` (list[str]): List of Pandas
            methods identified in the code
             (e.g., ["drop", "rename", "merge"]).
@@ -82,6 +84,9 @@ class Smell(ABC):
                 "tensorflow": ["fit", "evaluate", "predict"],
                 "sklearn": ["fit", "score"]
             }
+        - `nodes` (list[ast.AST]): All the nodes of `ast_node`,
+           in `ast.walk` order, collected once and shared by all rules
+           (see `walk`).
 
         Returns:
         - list[dict[str, any]]: A list of dictionaries,
@@ -119,3 +124,41 @@ class Smell(ABC):
             "description": self.description,
             "additional_info": additional_info,
         }
+
+    def walk(
+        self, ast_node: ast.AST, extracted_data: dict[str, any]
+    ) -> Iterable[ast.AST]:
+        """
+        Iterates over all the nodes of `ast_node`, like `ast.walk`.
+        The nodes collected in `extracted_data["nodes"]` are reused when
+        available, so that all rules share a single traversal.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node being analyzed.
+        - extracted_data (dict[str, any]): The extracted data
+          of `ast_node`.
+
+        Returns:
+        - Iterable[ast.AST]: The nodes of `ast_node`, in `ast.walk` order.
+        """
+        nodes = extracted_data.get("nodes")
+        if nodes is None:
+            return ast.walk(ast_node)
+        return nodes
+
+    def get_code_snippet(self, lines: list[str], lineno: int) -> str:
+        """
+        Retrieves the source code of a line from the `lines`
+        of the extracted data.
+
+        Parameters:
+        - lines (list[str]): Source lines indexed by line number.
+        - lineno (int): The line number to retrieve.
+
+        Returns:
+        - str: The source code of the line,
+          or a placeholder if it is not available.
+        """
+        if 0 < lineno < len(lines):
+            return lines[lineno]
+        return "<Code not available>"
@@ -4,6 +4,16 @@ import sys
 from matplotlib import pyplot as plt
 import pandas as pd
 
+# Use pyarrow, if available, as the CSV parser
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Columns of the analysis results the reports are built from
+REPORT_COLUMNS = ["filename", "smell_name"]
+
 
 class ReportGenerator:
     def __init__(self, input_path: str = ".", output_path: str = "."):
@@ -68,17 +78,64 @@ class ReportGenerator:
         dfs = []
         for file in file_paths:
             print(f"Loading file: {file}")
-            dfs.append(pd.read_csv(file))
+            dfs.append(
+                pd.read_csv(file, usecols=REPORT_COLUMNS, engine=CSV_ENGINE)
+            )
         return pd.concat(dfs, ignore_index=True)
 
-    def smell_report(self, df):
-        """Generates a general overview report."""
-        report = (
+    @staticmethod
+    def _project_names(filenames):
+        """
+        Maps file paths to the names of the folders containing them.
+
+        A project has many smells in the same files, so the paths are
+        factorized into integer codes: the name is computed once per
+        distinct path, and then taken by code for every row.
+
+        Parameters:
+        - filenames (pd.Series): The file paths.
+
+        Returns:
+        - pd.Series: The project name of each file path.
+        """
+        codes, uniques = pd.factorize(filenames, use_na_sentinel=False)
+        names = pd.Index([
+            os.path.basename(os.path.dirname(filename)) or "root"
+            for filename in uniques
+        ])
+        return pd.Series(
+            names.take(codes), index=filenames.index, name=filenames.name
+        )
+
+    @staticmethod
+    def _smell_occurrences(df):
+        """
+        Counts the occurrences of each smell, as shown by the general
+        overview of every report.
+        """
+        return (
             df.groupby("smell_name")["filename"]
             .count()
             .rename("occurrences")
             .reset_index()
         )
+
+    @staticmethod
+    def _project_totals(df):
+        """
+        Counts the smells of each project, from the `project_name`
+        column added by `_project_names`.
+        """
+        return (
+            df.groupby("project_name")["smell_name"]
+            .count()
+            .rename("total_smells")
+            .reset_index()
+        )
+
+    def smell_report(self, df):
+        """Generates a general overview report."""
+        report = self._smell_occurrences(df)
         report.to_csv(
             os.path.join(self.output_path, "general_overview.csv"), index=False
         )
@@ -90,15 +147,8 @@ class ReportGenerator:
         treating files as part of separate projects.
         """
         # Extract project names from file paths
-        df["project_name"] = df["filename"].apply(
-            lambda x: os.path.basename(os.path.dirname(x)) or "root"
-        )
-        report = (
-            df.groupby("project_name")["smell_name"]
-            .count()
-            .rename("total_smells")
-            .reset_index()
-        )
+        df["project_name"] = self._project_names(df["filename"])
+        report = self._project_totals(df)
         output_file = os.path.join(self.output_path, "project_overview.csv")
         report.to_csv(output_file, index=False)
         print(f"Project-specific report saved to '{output_file}'.")
@@ -110,18 +160,21 @@ class ReportGenerator:
         - Per-project summary of total smells.
         - Detailed sheets for each project.
         """
-        df["project_name"] = df["filename"].apply(
-            lambda x: os.path.basename(os.path.dirname(x)) or "root"
-        )
-        general_report = (
-            df.groupby("smell_name")["filename"]
+        df["project_name"] = self._project_names(df["filename"])
+        # Count the smells of all projects in a single groupby: the
+        # overview sheets are sums of these counts, and the detail sheets
+        # are their split by project
+        project_details = (
+            df.groupby(["project_name", "smell_name"])["filename"]
             .count()
             .rename("occurrences")
-            .reset_index()
+        )
+        general_report = (
+            project_details.groupby(level="smell_name").sum().reset_index()
         )
         project_summary = (
-            df.groupby("project_name")["smell_name"]
-            .count()
+            project_details.groupby(level="project_name")
+            .sum()
             .rename("total_smells")
             .reset_index()
         )
@@ -133,13 +186,10 @@ class ReportGenerator:
             project_summary.to_excel(
                 writer, sheet_name="Project Overview", index=False
             )
-            for project_name, project_df in df.groupby("project_name"):
-                details = (
-                    project_df.groupby("smell_name")["filename"]
-                    .count()
-                    .rename("occurrences")
-                    .reset_index()
-                )
+            for project_name, counts in project_details.groupby(
+                level="project_name"
+            ):
+                details = counts.droplevel("project_name").reset_index()
                 sanitized_name = project_name[
                     :30
                 ]  # Excel sheet names must be <= 31 chars
@@ -150,12 +200,7 @@ class ReportGenerator:
 
     def visualize_smell_report(self, df):
         """Generates a bar chart for the general smell overview."""
-        report = (
-            df.groupby("smell_name")["filename"]
-            .count()
-            .rename("occurrences")
-            .reset_index()
-        )
+        report = self._smell_occurrences(df)
         report.plot(kind="bar", x="smell_name", y="occurrences", legend=False)
         plt.title("Smell Occurrences by Type")
         plt.xlabel("Smell Type")
@@ -67,33 +67,61 @@ class FileUtils:
         """
         Merges analysis results from multiple projects into a single CSV.
 
+        The results are streamed: each CSV is read and appended to the
+        merged file in turn, so only one project's results are held in
+        memory at a time.
+
         Parameters:
         - input_dir (str): Directory containing
           analysis results (project_name.csv files).
         - output_dir (str): Directory where the merged results will be saved.
         """
-        dataframes = []
         print(f"Looking for CSV files in directory: {input_dir}")
 
-        for subdir, _, files in os.walk(input_dir):
-            for file in files:
-                if file.endswith(".csv"):
-                    file_path = os.path.join(subdir, file)
-                    try:
-                        df = pd.read_csv(file_path)
-                        if not df.empty:
-                            dataframes.append(df)
-                        else:
-                            print(f"Skipping empty CSV: {file_path}")
-                    except Exception as e:
-                        print(f"Failed to read {file_path}: {e}")
-
-        if dataframes:
-            combined_df = pd.concat(dataframes, ignore_index=True)
-            os.makedirs(output_dir, exist_ok=True)
-            combined_df.to_csv(
-                os.path.join(output_dir, "overview.csv"), index=False
+        csv_files = [
+            os.path.join(subdir, file)
+            for subdir, _, files in os.walk(input_dir)
+            for file in files
+            if file.endswith(".csv")
+        ]
+
+        # Read the headers (and first row) first, so that every chunk is
+        # written with the same columns, in the order pd.concat would have
+        # produced. Like pd.concat, only files with rows contribute columns.
+        columns = {}
+        files_with_rows = []
+        for file_path in csv_files:
+            try:
+                head = pd.read_csv(file_path, nrows=1)
+            except Exception as e:
+                print(f"Failed to read {file_path}: {e}")
+                continue
+            if head.empty:
+                print(f"Skipping empty CSV: {file_path}")
+                continue
+            columns.update(dict.fromkeys(head.columns))
+            files_with_rows.append(file_path)
+
+        output_file = os.path.join(output_dir, "overview.csv")
+        merged = False
+        for file_path in files_with_rows:
+            try:
+                df = pd.read_csv(file_path)
+            except Exception as e:
+                print(f"Failed to read {file_path}: {e}")
+                continue
+
+            if not merged:
+                os.makedirs(output_dir, exist_ok=True)
+            df.reindex(columns=list(columns)).to_csv(
+                output_file,
+                mode="a" if merged else "w",
+                header=not merged,
+                index=False,
             )
+            merged = True
+
+        if merged:
             print(f"Merged results saved to {output_dir}/overview.csv")
         else:
             print("No valid CSV files found to merge.")
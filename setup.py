@@ -19,6 +19,9 @@ setup(
         "matplotlib>=3.6.0",
         "openpyxl>=3.1.0",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=14.0.0"],
+    },
     include_package_data=True,
     package_data={
         "codesmile": ["resources/*.csv"],